@@ -1,11 +1,215 @@
 #!/usr/bin/env python3
+import argparse
+import base64
+import functools
+import io
 import json
-import matplotlib.pyplot as plt
+import mmap
 import numpy as np
 import sys
+from dataclasses import dataclass
 from pathlib import Path
 
-def generate_summary_markdown(data, output_dir):
+# orjson is considerably faster on large files; fall back to the stdlib parser if absent.
+# orjson parses a memoryview in place, the stdlib parser needs a bytes copy.
+try:
+    import orjson
+    _json_loads = orjson.loads
+except ImportError:
+    def _json_loads(buf):
+        return json.loads(bytes(buf))
+
+@dataclass
+class MetricSummary:
+    """Per-suite average, minimum, maximum and standard deviation of one metric."""
+    suites: tuple
+    avg: np.ndarray
+    min: np.ndarray
+    max: np.ndarray
+    std: np.ndarray
+    
+    @property
+    def is_constant(self):
+        """True when no suite shows any spread, e.g. single-measurement runs."""
+        return np.array_equal(self.min, self.max) and not self.std.any()
+
+# Size in inches of each plot. All plots are drawn as side-by-side panels of one
+# figure and each panel is cropped out into its own PNG.
+PANEL_SIZE = (12.5, 7)
+
+# Axes placement within a panel: left/bottom margins for the tick and axis labels,
+# right margin for the legend and std dev box. Suite names too long for the bottom
+# margin make the panel taller rather than the axes shorter (see extra_panel_height);
+# the right margin is fixed, so names much longer than ~12 characters are clipped in
+# the std dev box.
+PANEL_AXES_RECT = (0.06, 0.15, 0.75, 0.79)
+
+# Rough height in inches of each character of a 45° rotated tick label, and of the
+# axis label and padding below the tick labels
+TICK_LABEL_CHAR_HEIGHT = 0.06
+XLABEL_HEIGHT = 0.45
+
+# 150 DPI is plenty for on-screen viewing and has a quarter of the pixels of 300 DPI
+DEFAULT_DPI = 150
+
+def extra_panel_height(suites):
+    """Height in inches to add below the axes so rotated suite names aren't clipped."""
+    _, bottom, _, _ = PANEL_AXES_RECT
+    longest = max((len(suite) for suite in suites), default=0)
+    needed = XLABEL_HEIGHT + TICK_LABEL_CHAR_HEIGHT * longest
+    return max(0.0, needed - bottom * PANEL_SIZE[1])
+
+def new_figure(num_panels, extra_height=0.0):
+    """Create an Agg-backed figure with one axes per side-by-side panel."""
+    # matplotlib is slow to import, so keep it off the CLI usage/error paths
+    from matplotlib.backends.backend_agg import FigureCanvasAgg
+    from matplotlib.figure import Figure
+    
+    width, height = PANEL_SIZE
+    fig_height = height + extra_height
+    fig = Figure(figsize=(width * num_panels, fig_height))
+    FigureCanvasAgg(fig)
+    
+    left, bottom, ax_width, ax_height = PANEL_AXES_RECT
+    # Keep the axes the same size in inches, with the extra height below them
+    bottom = (bottom * height + extra_height) / fig_height
+    ax_height *= height / fig_height
+    axes = [fig.add_axes([(i + left) / num_panels, bottom, ax_width / num_panels, ax_height])
+            for i in range(num_panels)]
+    return fig, axes
+
+def fill_panel_width(ax):
+    """Widen a panel's axes into the right margin kept for the legend and std dev box."""
+    left, _, width, _ = PANEL_AXES_RECT
+    pos = ax.get_position()
+    # Panel width in figure coordinates; mirror the left margin on the right
+    panel_width = pos.width / width
+    ax.set_position([pos.x0, pos.y0, panel_width * (1 - 2 * left), pos.height])
+
+# Above this many samples np.std's (x - mean) temporary (128 MB) outweighs the numba JIT cost
+WELFORD_MIN_SAMPLES = 1 << 24
+
+def _welford_std(samples, ddof):
+    """One-pass (Welford) standard deviation without a temporary array."""
+    n = 0
+    mean = 0.0
+    m2 = 0.0
+    for x in samples:
+        n += 1
+        delta = x - mean
+        mean += delta / n
+        m2 += delta * (x - mean)
+    return (m2 / (n - ddof)) ** 0.5 if n > ddof else 0.0
+
+@functools.lru_cache(maxsize=None)
+def _get_welford():
+    """JIT-compile _welford_std on first use, or return None if numba is unavailable."""
+    try:
+        import numba
+    except ImportError:
+        return None
+    return numba.njit(cache=True)(_welford_std)
+
+def sample_std(samples):
+    """Sample standard deviation (ddof=1) of an array, or 0.0 for a single sample."""
+    if samples.size < 2:
+        return 0.0
+    if samples.size > WELFORD_MIN_SAMPLES:
+        welford = _get_welford()
+        if welford is not None:
+            return welford(samples, 1)
+    return samples.std(ddof=1)
+
+def save_panel(fig, axes, index, path, dpi=DEFAULT_DPI):
+    """Save one panel of a figure as PNG, favouring encode speed over file size."""
+    from matplotlib.transforms import Bbox
+    
+    width, _ = PANEL_SIZE
+    height = fig.get_figheight()
+    # Hide the other panels so only this one is drawn
+    for i, ax in enumerate(axes):
+        ax.set_visible(i == index)
+    # Encode in memory so the file is written with a single call
+    buf = io.BytesIO()
+    fig.savefig(buf, format='png', dpi=dpi,
+                bbox_inches=Bbox.from_bounds(index * width, 0, width, height),
+                # zlib level 1 encodes several times faster than the default level 6
+                # for a modest increase in file size
+                pil_kwargs={'compress_level': 1, 'optimize': False})
+    Path(path).write_bytes(buf.getbuffer())
+
+def load_performance_data(json_file_path):
+    """Load the performance JSON, returning None if it is missing or invalid."""
+    try:
+        with open(json_file_path, 'rb') as f:
+            # Map the file rather than reading it so it isn't copied into a Python buffer
+            try:
+                mm = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+            except OSError:
+                # Pipes and other non-regular files can't be mapped
+                return _json_loads(f.read())
+            with mm, memoryview(mm) as view:
+                return _json_loads(view)
+    except FileNotFoundError:
+        print(f"Error: JSON file {json_file_path} not found")
+    except ValueError:
+        # Decode errors from either parser, or mmap refusing an empty file
+        print(f"Error: Invalid JSON in {json_file_path}")
+    return None
+
+def raw_samples(suite_data, metric):
+    """Return a suite's raw samples for a metric as a float64 array.
+    
+    A '<metric>_b64' field holding base64-encoded little-endian float64 values is
+    preferred over the plain JSON list, as it decodes with a single copy. Raises
+    ValueError if the samples are malformed.
+    """
+    encoded = suite_data.get(f'{metric}_b64')
+    if encoded is not None:
+        # binascii.Error and a length that isn't a multiple of 8 are both ValueErrors
+        try:
+            return np.frombuffer(base64.b64decode(encoded, validate=True), dtype='<f8')
+        except (TypeError, ValueError):
+            raise ValueError(f"{metric}_b64 is not base64-encoded float64 data") from None
+    try:
+        samples = np.asarray(suite_data.get(metric, []), dtype=np.float64)
+    except (TypeError, ValueError):
+        samples = None
+    # A JSON null converts silently to NaN, so check for it explicitly
+    if samples is None or samples.ndim != 1 or np.isnan(samples).any():
+        raise ValueError(f"raw {metric} samples must be a list of numbers")
+    return samples
+
+def summarize_metric(averages, raw_data, metric, suites):
+    """Compute min, max and std dev of a metric for each suite from its raw samples."""
+    suites = tuple(suite for suite in suites if suite in averages)
+    n = len(suites)
+    avg_values = np.empty(n)
+    min_values = np.empty(n)
+    max_values = np.empty(n)
+    std_devs = np.empty(n)
+    
+    for i, suite in enumerate(suites):
+        average = averages[suite]
+        if isinstance(average, bool) or not isinstance(average, (int, float)):
+            raise ValueError(f"{metric} average for {suite} is not a number: {average!r}")
+        avg_values[i] = average
+        try:
+            samples = raw_samples(raw_data.get(suite, {}), metric)
+        except ValueError as e:
+            raise ValueError(f"{suite}: {e}") from None
+        if samples.size:
+            min_values[i] = samples.min()
+            max_values[i] = samples.max()
+            std_devs[i] = sample_std(samples)
+        else:
+            # Fallback if raw data is missing or empty
+            min_values[i] = max_values[i] = avg_values[i]
+            std_devs[i] = 0.0
+    
+    return MetricSummary(suites=suites, avg=avg_values, min=min_values, max=max_values, std=std_devs)
+
+def generate_summary_markdown(data, output_dir, suites):
     """Generate a markdown summary of the performance data."""
     instance_type = data.get('instance_type', 'Unknown')
     cpu_cores = data.get('cpu_cores', 'N/A')
@@ -24,8 +228,6 @@ def generate_summary_markdown(data, output_dir):
 ## Performance Summary
 """
     
-    suites = sorted(list(set(list(proving_times.keys()) + list(gas_costs.keys()))))
-    
     for suite in suites:
         md_content += f"\n### {suite}\n\n"
         if suite in proving_times:
@@ -34,389 +236,175 @@ def generate_summary_markdown(data, output_dir):
             md_content += f"- **Gas Cost:** {int(gas_costs[suite]):,} gas\n"
             
     summary_path = Path(output_dir) / 'performance_summary.md'
-    with open(summary_path, 'w') as f:
-        f.write(md_content)
+    summary_path.write_text(md_content, encoding='utf-8')
     print(f"Generated markdown summary: {summary_path}")
 
-def generate_plots(json_file_path):
-    """Generate performance plots from JSON data file."""
+def plot_proving_times(ax, stats, instance_type):
+    """Draw a grouped min/avg/max bar chart of proving times."""
+    suites = stats.suites
+    avg_times, min_times, max_times, std_devs = stats.avg, stats.min, stats.max, stats.std
     
-    # Set up matplotlib for headless operation
-    plt.switch_backend('Agg')
+    x = np.arange(len(suites))
+    ax.set_xlabel('ZK-SNARK Suite')
+    ax.set_ylabel('Proving Time (seconds)')
+    ax.set_title(f'ZK-SNARK Proving Times - {instance_type}')
+    ax.set_xticks(x)
+    ax.set_xticklabels(suites, rotation=45)
+    ax.grid(True, alpha=0.3)
     
-    # Load performance data
-    try:
-        with open(json_file_path) as f:
-            data = json.load(f)
-    except FileNotFoundError:
-        print(f"Error: JSON file {json_file_path} not found")
-        return False
-    except json.JSONDecodeError:
-        print(f"Error: Invalid JSON in {json_file_path}")
-        return False
+    # Add value labels on bars
+    def add_value_labels(bars, values):
+        ax.bar_label(bars, labels=[f'{value:.3f}s' for value in values], padding=3, fontsize=8)
     
-    instance_type = data.get('instance_type', 'Unknown')
-    proving_times = data.get('proving_times', {})
-    verification_times = data.get('verification_times', {})
-    gas_costs = data.get('gas_costs', {})
-    raw_data = data.get('raw_data', {})
+    if stats.is_constant:
+        # Min, max and average coincide, so a single bar per suite says it all and
+        # there is no legend or std dev box to make room for
+        fill_panel_width(ax)
+        bars = ax.bar(x, avg_times, 0.6, alpha=0.8, color='#1f77b4')
+        add_value_labels(bars, avg_times)
+        return
     
-    # Get output directory from JSON file location
-    output_dir = Path(json_file_path).parent
+    # Create grouped bar chart
+    width = 0.25
+    bars1 = ax.bar(x - width, min_times, width, label='Minimum', alpha=0.8, color='#2ca02c')
+    bars2 = ax.bar(x, avg_times, width, label='Average', alpha=0.8, color='#1f77b4')  
+    bars3 = ax.bar(x + width, max_times, width, label='Maximum', alpha=0.8, color='#d62728')
     
-    # Generate the markdown summary
-    generate_summary_markdown(data, output_dir)
+    # Create custom legend and place it outside the plot
+    ax.legend(title='Statistics', bbox_to_anchor=(1.05, 1), loc='upper left', borderaxespad=0.)
     
-    # Generate proving times plot with min, max, average
-    if proving_times:
-        suites = list(proving_times.keys())
-        avg_times = list(proving_times.values())
-        
-        # Calculate min, max, and std dev from raw data
-        min_times = []
-        max_times = []
-        std_devs = []
-        
-        for suite in suites:
-            if suite in raw_data and 'proving_times' in raw_data[suite]:
-                individual_times = raw_data[suite]['proving_times']
-                min_times.append(min(individual_times))
-                max_times.append(max(individual_times))
-                if len(individual_times) > 1:
-                    std_devs.append(np.std(individual_times, ddof=1))
-                else:
-                    std_devs.append(0)
-            else:
-                min_times.append(avg_times[len(min_times)])
-                max_times.append(avg_times[len(max_times)])
-                std_devs.append(0)
-        
-        # Create grouped bar chart
-        x = np.arange(len(suites))
-        width = 0.25
-        
-        plt.figure(figsize=(12, 7))
-        
-        bars1 = plt.bar(x - width, min_times, width, label='Minimum', alpha=0.8, color='#2ca02c')
-        bars2 = plt.bar(x, avg_times, width, label='Average', alpha=0.8, color='#1f77b4')  
-        bars3 = plt.bar(x + width, max_times, width, label='Maximum', alpha=0.8, color='#d62728')
-        
-        plt.xlabel('ZK-SNARK Suite')
-        plt.ylabel('Proving Time (seconds)')
-        plt.title(f'ZK-SNARK Proving Times - {instance_type}')
-        plt.xticks(x, suites, rotation=45)
-        plt.grid(True, alpha=0.3)
-        
-        # Add std dev info to legend
-        legend_labels = []
-        for i, suite in enumerate(suites):
-            if std_devs[i] > 0:
-                legend_labels.append(f'{suite}: σ={std_devs[i]:.3f}s')
-            else:
-                legend_labels.append(f'{suite}: single measurement')
-        
-        # Create custom legend and place it outside the plot
-        plt.legend(title='Statistics', bbox_to_anchor=(1.05, 1), loc='upper left', borderaxespad=0.)
-        
-        # Add std dev text outside the plot
-        std_text = "Standard Deviations:\n" + "\n".join(legend_labels)
-        plt.text(1.05, 0.8, std_text, transform=plt.gca().transAxes, 
-                 verticalalignment='top', horizontalalignment='left',
-                 bbox=dict(boxstyle='round', facecolor='wheat', alpha=0.8),
-                 fontsize=9)
-        
-        # Add value labels on bars
-        def add_value_labels(bars, values):
-            for bar, value in zip(bars, values):
-                plt.text(bar.get_x() + bar.get_width()/2, bar.get_height() + max(max_times)*0.01,
-                        f'{value:.3f}s', ha='center', va='bottom', fontsize=8, rotation=0)
-        
-        add_value_labels(bars1, min_times)
-        add_value_labels(bars2, avg_times)
-        add_value_labels(bars3, max_times)
-        
-        plt.tight_layout()
-        plt.savefig(output_dir / 'proving_times.png', dpi=300, bbox_inches='tight')
-        plt.close()
-        print("Generated proving_times.png")
-    
-    # Generate gas consumption plot with min, max, average
-    if gas_costs:
-        suites = list(gas_costs.keys())
-        avg_costs = list(gas_costs.values())
-        
-        # Calculate min, max, and std dev from raw data
-        min_costs = []
-        max_costs = []
-        std_devs = []
-        
-        for suite in suites:
-            if suite in raw_data and 'gas_costs' in raw_data[suite]:
-                individual_costs = raw_data[suite]['gas_costs']
-                if individual_costs:
-                    min_costs.append(min(individual_costs))
-                    max_costs.append(max(individual_costs))
-                    if len(individual_costs) > 1:
-                        std_devs.append(np.std(individual_costs, ddof=1))
-                    else:
-                        std_devs.append(0)
-                else:
-                    # Handle case where gas_costs array is empty
-                    avg_val = avg_costs[len(min_costs)]
-                    min_costs.append(avg_val)
-                    max_costs.append(avg_val)
-                    std_devs.append(0)
-            else:
-                # Fallback if raw data is missing
-                avg_val = avg_costs[len(min_costs)]
-                min_costs.append(avg_val)
-                max_costs.append(avg_val)
-                std_devs.append(0)
+    # Add std dev text outside the plot
+    std_text = "Standard Deviations:\n" + "\n".join(
+        f'{suite}: σ={sd:.3f}s' if sd > 0 else f'{suite}: single measurement'
+        for suite, sd in zip(suites, std_devs)
+    )
+    ax.text(1.05, 0.8, std_text, transform=ax.transAxes, 
+            verticalalignment='top', horizontalalignment='left',
+            bbox=dict(boxstyle='round', facecolor='wheat', alpha=0.8),
+            fontsize=9)
+    
+    add_value_labels(bars1, min_times)
+    add_value_labels(bars2, avg_times)
+    add_value_labels(bars3, max_times)
 
-        # Create grouped bar chart
-        x = np.arange(len(suites))
-        width = 0.25
-        
-        plt.figure(figsize=(12, 7))
-        
-        bars1 = plt.bar(x - width, min_costs, width, label='Minimum', alpha=0.8, color='#2ca02c')
-        bars2 = plt.bar(x, avg_costs, width, label='Average', alpha=0.8, color='#1f77b4')  
-        bars3 = plt.bar(x + width, max_costs, width, label='Maximum', alpha=0.8, color='#d62728')
-        
-        plt.xlabel('ZK-SNARK Suite')
-        plt.ylabel('Gas Consumption')
-        plt.title(f'ZK-SNARK Gas Consumption - {instance_type}')
-        plt.xticks(x, suites, rotation=45)
-        plt.grid(True, alpha=0.3)
-        plt.ticklabel_format(style='scientific', axis='y', scilimits=(0,0))
-        
-        # Add std dev info to legend
-        legend_labels = []
-        for i, suite in enumerate(suites):
-            if std_devs[i] > 0:
-                legend_labels.append(f'{suite}: σ={std_devs[i]:.2f}')
-            else:
-                legend_labels.append(f'{suite}: deterministic')
-        
-        # Create custom legend and place it outside the plot
-        plt.legend(title='Statistics', bbox_to_anchor=(1.05, 1), loc='upper left', borderaxespad=0.)
-        
-        # Add std dev text outside the plot
-        std_text = "Standard Deviations:\n" + "\n".join(legend_labels)
-        plt.text(1.05, 0.8, std_text, transform=plt.gca().transAxes, 
-                 verticalalignment='top', horizontalalignment='left',
-                 bbox=dict(boxstyle='round', facecolor='wheat', alpha=0.8),
-                 fontsize=9)
-        
-        # Add value labels on bars
-        def add_value_labels(bars, values):
-            for bar, value in zip(bars, values):
-                plt.text(bar.get_x() + bar.get_width()/2, bar.get_height() + max(max_costs)*0.02,
-                        f'{value:.0f}', ha='center', va='bottom', fontsize=8, rotation=0)
-        
-        add_value_labels(bars1, min_costs)
-        add_value_labels(bars2, avg_costs)
-        add_value_labels(bars3, max_costs)
-        
-        plt.tight_layout()
-        plt.savefig(output_dir / 'gas_consumption.png', dpi=300, bbox_inches='tight')
-        plt.close()
-        print("Generated gas_consumption.png")
+def plot_gas_costs(ax, stats, instance_type):
+    """Draw a grouped min/avg/max bar chart of verification gas costs."""
+    suites = stats.suites
+    avg_costs, min_costs, max_costs, std_devs = stats.avg, stats.min, stats.max, stats.std
     
-    print("Plot generation completed!")
-    return True
-    """Generate performance plots from JSON data file."""
+    x = np.arange(len(suites))
+    ax.set_xlabel('ZK-SNARK Suite')
+    ax.set_ylabel('Gas Consumption')
+    ax.set_title(f'ZK-SNARK Gas Consumption - {instance_type}')
+    ax.set_xticks(x)
+    ax.set_xticklabels(suites, rotation=45)
+    ax.grid(True, alpha=0.3)
+    ax.ticklabel_format(style='scientific', axis='y', scilimits=(0,0))
     
-    # Set up matplotlib for headless operation
-    plt.switch_backend('Agg')
+    # Add value labels on bars
+    def add_value_labels(bars, values):
+        ax.bar_label(bars, labels=[f'{value:.0f}' for value in values], padding=3, fontsize=8)
     
-    # Load performance data
-    try:
-        with open(json_file_path) as f:
-            data = json.load(f)
-    except FileNotFoundError:
-        print(f"Error: JSON file {json_file_path} not found")
-        return False
-    except json.JSONDecodeError:
-        print(f"Error: Invalid JSON in {json_file_path}")
-        return False
+    if stats.is_constant:
+        # Min, max and average coincide, so a single bar per suite says it all and
+        # there is no legend or std dev box to make room for
+        fill_panel_width(ax)
+        bars = ax.bar(x, avg_costs, 0.6, alpha=0.8, color='#1f77b4')
+        add_value_labels(bars, avg_costs)
+        return
+    
+    # Create grouped bar chart
+    width = 0.25
+    bars1 = ax.bar(x - width, min_costs, width, label='Minimum', alpha=0.8, color='#2ca02c')
+    bars2 = ax.bar(x, avg_costs, width, label='Average', alpha=0.8, color='#1f77b4')  
+    bars3 = ax.bar(x + width, max_costs, width, label='Maximum', alpha=0.8, color='#d62728')
+    
+    # Create custom legend and place it outside the plot
+    ax.legend(title='Statistics', bbox_to_anchor=(1.05, 1), loc='upper left', borderaxespad=0.)
+    
+    # Add std dev text outside the plot
+    std_text = "Standard Deviations:\n" + "\n".join(
+        f'{suite}: σ={sd:.2f}' if sd > 0 else f'{suite}: deterministic'
+        for suite, sd in zip(suites, std_devs)
+    )
+    ax.text(1.05, 0.8, std_text, transform=ax.transAxes, 
+            verticalalignment='top', horizontalalignment='left',
+            bbox=dict(boxstyle='round', facecolor='wheat', alpha=0.8),
+            fontsize=9)
     
+    add_value_labels(bars1, min_costs)
+    add_value_labels(bars2, avg_costs)
+    add_value_labels(bars3, max_costs)
+
+def generate_plots(data, proving_stats, gas_stats, output_dir, dpi=DEFAULT_DPI):
+    """Generate performance plots from loaded performance data and its statistics."""
     instance_type = data.get('instance_type', 'Unknown')
+    
+    # Collect the plots to draw: (plot function, statistics, output file name)
+    panels = []
+    if proving_stats.suites:
+        panels.append((plot_proving_times, proving_stats, 'proving_times.png'))
+    if gas_stats.suites:
+        panels.append((plot_gas_costs, gas_stats, 'gas_consumption.png'))
+    
+    if panels:
+        # Draw all plots on one figure so fonts and canvas are set up once
+        suites = set().union(*(stats.suites for _, stats, _ in panels))
+        fig, axes = new_figure(len(panels), extra_panel_height(suites))
+        for ax, (plot, stats, _) in zip(axes, panels):
+            plot(ax, stats, instance_type)
+        
+        for index, (_, _, filename) in enumerate(panels):
+            save_panel(fig, axes, index, output_dir / filename, dpi)
+            print(f"Generated {filename}")
+    
+    print("Plot generation completed!")
+    return True
+
+def generate_reports(json_file_path, dpi=DEFAULT_DPI):
+    """Generate the markdown summary and plots next to a performance JSON file."""
+    data = load_performance_data(json_file_path)
+    if data is None:
+        return False
+    
     proving_times = data.get('proving_times', {})
-    verification_times = data.get('verification_times', {})
     gas_costs = data.get('gas_costs', {})
     raw_data = data.get('raw_data', {})
     
-    # Get output directory from JSON file location
+    # Reports are written alongside the JSON file
     output_dir = Path(json_file_path).parent
     
-    # Generate the markdown summary
-    generate_summary_markdown(data, output_dir)
+    # Every report lists suites in the same sorted order
+    suites = tuple(sorted(set(proving_times) | set(gas_costs)))
     
-    # Generate proving times plot with min, max, average
-    if proving_times:
-        suites = list(proving_times.keys())
-        avg_times = list(proving_times.values())
-        
-        # Calculate min, max, and std dev from raw data
-        min_times = []
-        max_times = []
-        std_devs = []
-        
-        for suite in suites:
-            if suite in raw_data and 'proving_times' in raw_data[suite]:
-                individual_times = raw_data[suite]['proving_times']
-                min_times.append(min(individual_times))
-                max_times.append(max(individual_times))
-                if len(individual_times) > 1:
-                    std_devs.append(np.std(individual_times, ddof=1))
-                else:
-                    std_devs.append(0)
-            else:
-                min_times.append(avg_times[len(min_times)])
-                max_times.append(avg_times[len(max_times)])
-                std_devs.append(0)
-        
-        # Create grouped bar chart
-        x = np.arange(len(suites))
-        width = 0.25
-        
-        plt.figure(figsize=(12, 7))
-        
-        bars1 = plt.bar(x - width, min_times, width, label='Minimum', alpha=0.8, color='#2ca02c')
-        bars2 = plt.bar(x, avg_times, width, label='Average', alpha=0.8, color='#1f77b4')  
-        bars3 = plt.bar(x + width, max_times, width, label='Maximum', alpha=0.8, color='#d62728')
-        
-        plt.xlabel('ZK-SNARK Suite')
-        plt.ylabel('Proving Time (seconds)')
-        plt.title(f'ZK-SNARK Proving Times - {instance_type}')
-        plt.xticks(x, suites, rotation=45)
-        plt.grid(True, alpha=0.3)
-        
-        # Add std dev info to legend
-        legend_labels = []
-        for i, suite in enumerate(suites):
-            if std_devs[i] > 0:
-                legend_labels.append(f'{suite}: σ={std_devs[i]:.3f}s')
-            else:
-                legend_labels.append(f'{suite}: single measurement')
-        
-        # Create custom legend and place it outside the plot
-        plt.legend(title='Statistics', bbox_to_anchor=(1.05, 1), loc='upper left', borderaxespad=0.)
-        
-        # Add std dev text outside the plot
-        std_text = "Standard Deviations:\n" + "\n".join(legend_labels)
-        plt.text(1.05, 0.8, std_text, transform=plt.gca().transAxes, 
-                 verticalalignment='top', horizontalalignment='left',
-                 bbox=dict(boxstyle='round', facecolor='wheat', alpha=0.8),
-                 fontsize=9)
-        
-        # Add value labels on bars
-        def add_value_labels(bars, values):
-            for bar, value in zip(bars, values):
-                plt.text(bar.get_x() + bar.get_width()/2, bar.get_height() + max(max_times)*0.01,
-                        f'{value:.3f}s', ha='center', va='bottom', fontsize=8, rotation=0)
-        
-        add_value_labels(bars1, min_times)
-        add_value_labels(bars2, avg_times)
-        add_value_labels(bars3, max_times)
-        
-        plt.tight_layout()
-        plt.savefig(output_dir / 'proving_times.png', dpi=300, bbox_inches='tight')
-        plt.close()
-        print("Generated proving_times.png")
-    
-    # Generate gas consumption plot with min, max, average
-    if gas_costs:
-        suites = list(gas_costs.keys())
-        avg_costs = list(gas_costs.values())
-        
-        # Calculate min, max, and std dev from raw data
-        min_costs = []
-        max_costs = []
-        std_devs = []
-        
-        for suite in suites:
-            if suite in raw_data and 'gas_costs' in raw_data[suite]:
-                individual_costs = raw_data[suite]['gas_costs']
-                if individual_costs:
-                    min_costs.append(min(individual_costs))
-                    max_costs.append(max(individual_costs))
-                    if len(individual_costs) > 1:
-                        std_devs.append(np.std(individual_costs, ddof=1))
-                    else:
-                        std_devs.append(0)
-                else:
-                    # Handle case where gas_costs array is empty
-                    avg_val = avg_costs[len(min_costs)]
-                    min_costs.append(avg_val)
-                    max_costs.append(avg_val)
-                    std_devs.append(0)
-            else:
-                # Fallback if raw data is missing
-                avg_val = avg_costs[len(min_costs)]
-                min_costs.append(avg_val)
-                max_costs.append(avg_val)
-                std_devs.append(0)
-
-        # Create grouped bar chart
-        x = np.arange(len(suites))
-        width = 0.25
-        
-        plt.figure(figsize=(12, 7))
-        
-        bars1 = plt.bar(x - width, min_costs, width, label='Minimum', alpha=0.8, color='#2ca02c')
-        bars2 = plt.bar(x, avg_costs, width, label='Average', alpha=0.8, color='#1f77b4')  
-        bars3 = plt.bar(x + width, max_costs, width, label='Maximum', alpha=0.8, color='#d62728')
-        
-        plt.xlabel('ZK-SNARK Suite')
-        plt.ylabel('Gas Consumption')
-        plt.title(f'ZK-SNARK Gas Consumption - {instance_type}')
-        plt.xticks(x, suites, rotation=45)
-        plt.grid(True, alpha=0.3)
-        plt.ticklabel_format(style='scientific', axis='y', scilimits=(0,0))
-        
-        # Add std dev info to legend
-        legend_labels = []
-        for i, suite in enumerate(suites):
-            if std_devs[i] > 0:
-                legend_labels.append(f'{suite}: σ={std_devs[i]:.2f}')
-            else:
-                legend_labels.append(f'{suite}: deterministic')
-        
-        # Create custom legend and place it outside the plot
-        plt.legend(title='Statistics', bbox_to_anchor=(1.05, 1), loc='upper left', borderaxespad=0.)
-        
-        # Add std dev text outside the plot
-        std_text = "Standard Deviations:\n" + "\n".join(legend_labels)
-        plt.text(1.05, 0.8, std_text, transform=plt.gca().transAxes, 
-                 verticalalignment='top', horizontalalignment='left',
-                 bbox=dict(boxstyle='round', facecolor='wheat', alpha=0.8),
-                 fontsize=9)
-        
-        # Add value labels on bars
-        def add_value_labels(bars, values):
-            for bar, value in zip(bars, values):
-                plt.text(bar.get_x() + bar.get_width()/2, bar.get_height() + max(max_costs)*0.02,
-                        f'{value:.0f}', ha='center', va='bottom', fontsize=8, rotation=0)
-        
-        add_value_labels(bars1, min_costs)
-        add_value_labels(bars2, avg_costs)
-        add_value_labels(bars3, max_costs)
-        
-        plt.tight_layout()
-        plt.savefig(output_dir / 'gas_consumption.png', dpi=300, bbox_inches='tight')
-        plt.close()
-        print("Generated gas_consumption.png")
+    # Validate and summarize everything before writing any report
+    try:
+        proving_stats = summarize_metric(proving_times, raw_data, 'proving_times', suites)
+        gas_stats = summarize_metric(gas_costs, raw_data, 'gas_costs', suites)
+    except ValueError as e:
+        print(f"Error: Invalid performance data in {json_file_path}: {e}")
+        return False
     
-    print("Plot generation completed!")
-    return True
+    generate_summary_markdown(data, output_dir, suites)
+    return generate_plots(data, proving_stats, gas_stats, output_dir, dpi)
+
+def positive_int(value):
+    """argparse type for options that must be a positive integer."""
+    try:
+        number = int(value)
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"invalid int value: '{value}'") from None
+    if number <= 0:
+        raise argparse.ArgumentTypeError(f"must be a positive integer, got {number}")
+    return number
 
 if __name__ == "__main__":
-    if len(sys.argv) != 2:
-        print("Usage: python3 generate_plots.py <performance_data.json>")
-        sys.exit(1)
+    parser = argparse.ArgumentParser(description='Generate benchmark plots and a markdown summary.')
+    parser.add_argument('json_file', metavar='performance_data.json',
+                        help='performance data collected from a benchmark run')
+    parser.add_argument('--dpi', type=positive_int, default=DEFAULT_DPI,
+                        help=f'resolution of the generated PNGs (default: {DEFAULT_DPI})')
+    args = parser.parse_args()
     
-    json_file = sys.argv[1]
-    success = generate_plots(json_file)
+    success = generate_reports(args.json_file, dpi=args.dpi)
     sys.exit(0 if success else 1) 
\ No newline at end of file